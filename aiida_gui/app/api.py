@@ -1,5 +1,6 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from aiida.manage import manager
 from aiida_gui.app.workchain import router as workchain_router
 from aiida_gui.app.task import router as task_router
@@ -9,6 +10,7 @@ from aiida_gui.app.data_node import router as datanode_router
 from aiida_gui.app.group_node import router as groupnode_router
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
+from contextlib import asynccontextmanager
 import os
 
 from fastapi.responses import FileResponse
@@ -27,12 +29,43 @@ class BackendSettings(BaseSettings):
     """
 
     aiida_workgraph_gui_profile: str = ""  # if empty aiida uses default profile
+    # Number of threads running blocking database queries, the connection pool
+    # of the storage is sized to match so threads do not wait for a connection.
+    aiida_workgraph_gui_db_threads: int = 15
 
 
 backend_settings = BackendSettings()
 
-app = FastAPI()
-manager.get_manager().load_profile(backend_settings.aiida_workgraph_gui_profile)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    import anyio
+
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = backend_settings.aiida_workgraph_gui_db_threads
+    yield
+
+
+def configure_storage_pool(profile, pool_size: int) -> None:
+    """Keep one persistent, health-checked database connection per query thread.
+
+    Must run before the storage is first accessed, since the SQLAlchemy engine
+    is created from ``engine_kwargs`` then. Values set in the profile win.
+    """
+    if profile.storage_backend != "core.psql_dos":
+        return
+    engine_kwargs = profile.storage_config.setdefault("engine_kwargs", {})
+    engine_kwargs.setdefault("pool_size", pool_size)
+    engine_kwargs.setdefault("max_overflow", 10)
+    engine_kwargs.setdefault("pool_recycle", 1800)
+    engine_kwargs.setdefault("pool_pre_ping", True)
+
+
+app = FastAPI(lifespan=lifespan)
+profile = manager.get_manager().load_profile(
+    backend_settings.aiida_workgraph_gui_profile
+)
+configure_storage_pool(profile, backend_settings.aiida_workgraph_gui_db_threads)
 
 app.add_middleware(
     CORSMiddleware,
@@ -41,6 +74,8 @@ app.add_middleware(
     allow_methods=["*"],  # Allows all methods
     allow_headers=["*"],  # Allows all headers
 )
+# list pages repeat the same keys on every row and compress very well
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
 @app.get("/api", tags=["root"])
@@ -71,7 +106,7 @@ async def debug() -> dict:
 
 
 @app.get("/backend-setting")
-async def backend_settings():
+async def read_backend_settings():
     return backend_settings
 
 
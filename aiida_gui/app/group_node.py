@@ -1,46 +1,52 @@
 from __future__ import annotations
+from datetime import datetime
 from typing import Dict, Optional, Union, List
 from fastapi import HTTPException, Query
-from aiida_gui.app.node_table import make_node_router
+from aiida_gui.app.node_table import (
+    make_node_router,
+    fetch_page,
+    projected_keys,
+    clear_page_cache,
+    datagrid_order_by,
+    SortField,
+    SortOrder,
+)
 from aiida import orm
+from aiida_gui.app.utils import run_in_db_thread, ORJSONResponse
 import traceback
 
 project = ["id", "uuid", "time", "label", "description"]
 
 
-def projected_data_to_dict(qb, project):
+def projected_data_to_dict(rows, project):
     """
-    Convert the projected data from a QueryBuilder to a list of dictionaries.
+    Convert the projected rows of a QueryBuilder to a list of dictionaries.
     """
     from aiida_gui.app.utils import time_ago
+    from dateutil.tz import tzlocal
 
-    # Iterate over the results and convert each row to a dictionary
-    results = []
-    for row in qb.all():
-        item = dict(zip(project or [], row))
-        # Add computed/presentational fields
-        item["pk"] = item.pop("id")
-        item["ctime"] = time_ago(item.get("ctime"))
-        results.append(item)
+    now = datetime.now(tzlocal())
+    keys = projected_keys(project)
+    results = [dict(zip(keys, row)) for row in rows]
+    for item in results:
+        item["ctime"] = time_ago(item["ctime"], now=now)
     return results
 
 
 # due to a bug in aiida-core: https://github.com/aiidateam/aiida-core/pull/6828
 # we need use `time` instead of `ctime`
-def projected_data_to_dict_group(qb, project):
+def projected_data_to_dict_group(rows, project):
     """
-    Convert the projected data from a QueryBuilder to a list of dictionaries.
+    Convert the projected rows of a QueryBuilder to a list of dictionaries.
     """
     from aiida_gui.app.utils import time_ago
+    from dateutil.tz import tzlocal
 
-    # Iterate over the results and convert each row to a dictionary
-    results = []
-    for row in qb.all():
-        item = dict(zip(project or [], row))
-        # Add computed/presentational fields
-        item["pk"] = item.pop("id")
-        item["ctime"] = time_ago(item.get("time"))
-        results.append(item)
+    now = datetime.now(tzlocal())
+    keys = projected_keys(project)
+    results = [dict(zip(keys, row)) for row in rows]
+    for item in results:
+        item["ctime"] = time_ago(item["time"], now=now)
     return results
 
 
@@ -50,6 +56,8 @@ router = make_node_router(
     project=project,
     get_data_func=projected_data_to_dict_group,
     inclue_delete_route=False,
+    # groups store their creation time in ``time``
+    sort_field_map={"ctime": "time"},
 )
 
 
@@ -74,13 +82,13 @@ async def read_group_summary(id: int) -> Dict[str, Union[str, int]]:
 # ─ 3. paginated members
 #      GET /api/groupnode/{id}/members-data   (same contract as -data)
 # ---------------------------------------------------------------------------
-@router.get("/api/groupnode/{id}/members-data")
+@router.get("/api/groupnode/{id}/members-data", response_class=ORJSONResponse)
 async def read_group_members(
     id: int,
     skip: int = Query(0, ge=0),
     limit: int = Query(15, gt=0, le=500),
-    sortField: str = Query("pk"),
-    sortOrder: str = Query("desc", pattern="^(asc|desc)$"),
+    sortField: SortField = Query("pk"),
+    sortOrder: SortOrder = Query("desc"),
     filterModel: Optional[str] = Query(None),
 ):
 
@@ -111,12 +119,11 @@ async def read_group_members(
             "node", translate_datagrid_filter_json(filterModel, project=project)
         )
 
-    qb.order_by({"node": {sortField: sortOrder}})
-    total = qb.count()
-    qb.offset(skip).limit(limit)
-
-    results = projected_data_to_dict(qb, project)
-    return {"total": total, "data": results}
+    qb.order_by({"node": datagrid_order_by(sortField, sortOrder)})
+    total, results = await run_in_db_thread(
+        fetch_page, qb, skip, limit, projected_data_to_dict, project
+    )
+    return ORJSONResponse({"total": total, "data": results})
 
 
 @router.delete("/api/groupnode/delete" + "/{id}")
@@ -140,6 +147,7 @@ async def delete(
         else:
             orm.Group.collection.delete(id)
             ok = True
+        clear_page_cache()
         return {
             "deleted": ok,
             "message": (
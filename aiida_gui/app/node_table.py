@@ -1,7 +1,11 @@
 from __future__ import annotations
+from datetime import datetime
 from fastapi import APIRouter, Query, Body, HTTPException
 from aiida import orm
-from typing import Type, Dict, List, Union, Optional
+from typing import Any, Literal, Type, Dict, List, Tuple, Union, Optional
+import time
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 
 process_project = [
@@ -20,47 +24,251 @@ process_project = [
 ]
 
 
-def projected_data_to_dict_process(qb, project):
+# DataGrid columns the list endpoints can sort by, validated by FastAPI
+SortField = Literal[
+    "pk",
+    "ctime",
+    "node_type",
+    "process_label",
+    "process_state",
+    "paused",
+    "label",
+    "description",
+]
+SortOrder = Literal["asc", "desc"]
+
+
+def datagrid_order_by(
+    field: SortField, order: SortOrder, field_map: Optional[Dict[str, str]] = None
+) -> dict:
     """
-    Convert the projected data from a QueryBuilder to a list of dictionaries.
+    Translate a DataGrid sort into a QueryBuilder ``order_by`` spec.
+
+    ``field_map`` overrides entries of ``DATAGRID_FIELD_MAP`` for entities whose
+    columns are named differently, e.g. ``orm.Group`` has ``time`` not ``ctime``.
+    """
+    from aiida_gui.app.utils import DATAGRID_FIELD_MAP
+
+    column = (field_map or {}).get(field) or DATAGRID_FIELD_MAP[field]
+    if column.startswith("attributes."):
+        # attributes are JSON and must be cast to be sortable
+        return {column: {"order": order, "cast": "t"}}
+    return {column: order}
+
+
+# Unfiltered list pages are polled by every open UI, keep them for a short time.
+# Entries are dropped on any write through these routers, the TTL bounds the
+# staleness of changes made elsewhere (e.g. by the daemon).
+PAGE_CACHE_TTL = 2.0
+_page_cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+
+
+def get_cached_page(key: Tuple) -> Optional[Dict[str, Any]]:
+    """Return the cached payload of an unfiltered list page, if still fresh."""
+    entry = _page_cache.get(key)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1]
+
+
+def cache_page(key: Tuple, payload: Dict[str, Any]) -> None:
+    """Store the payload of an unfiltered list page and drop expired entries."""
+    now = time.monotonic()
+    for stale in [k for k, (expiry, _) in _page_cache.items() if expiry < now]:
+        del _page_cache[stale]
+    _page_cache[key] = (now + PAGE_CACHE_TTL, payload)
+
+
+def clear_page_cache() -> None:
+    """Invalidate all cached list pages, e.g. after a node was modified."""
+    _page_cache.clear()
+
+
+def projected_keys(project) -> tuple:
+    """
+    Return the DataGrid field names of the projections, i.e. ``id`` becomes
+    ``pk`` and ``attributes.process_label`` becomes ``process_label``.
+    """
+    return tuple(
+        "pk" if key == "id" else key.split(".", 1)[-1] for key in project or []
+    )
+
+
+def projected_data_to_dict_process(rows, project):
+    """
+    Convert the projected rows of a QueryBuilder to a list of dictionaries.
     """
     from aiida_gui.app.utils import time_ago
+    from dateutil.tz import tzlocal
 
-    # Iterate over the results and convert each row to a dictionary
-    results = []
-    for row in qb.all():
-        item = dict(zip(project or [], row))
-        # Add computed/presentational fields
-        item["pk"] = item.pop("id")
-        item["ctime"] = time_ago(item.pop("ctime"))
-        item["process_label"] = item.pop("attributes.process_label")
-        process_state = item.pop("attributes.process_state")
+    now = datetime.now(tzlocal())
+    # Map every row onto the same key tuple, then fix up the computed fields
+    keys = projected_keys(project)
+    results = [dict(zip(keys, row)) for row in rows]
+    for item in results:
+        item["ctime"] = time_ago(item["ctime"], now=now)
+        process_state = item["process_state"]
         item["process_state"] = process_state.title() if process_state else None
-        item["process_status"] = item.pop("attributes.process_status")
-        item["exit_status"] = item.pop("attributes.exit_status")
-        item["exit_message"] = item.pop("attributes.exit_message")
-        item["paused"] = item.pop("attributes.paused")
-        results.append(item)
     return results
 
 
-def projected_data_to_dict(qb, project):
+def projected_data_to_dict(rows, project):
     """
-    Convert the projected data from a QueryBuilder to a list of dictionaries.
+    Convert the projected rows of a QueryBuilder to a list of dictionaries.
     """
     from aiida_gui.app.utils import time_ago
+    from dateutil.tz import tzlocal
 
-    # Iterate over the results and convert each row to a dictionary
-    results = []
-    for row in qb.all():
-        item = dict(zip(project or [], row))
-        # Add computed/presentational fields
-        item["pk"] = item.pop("id")
-        item["ctime"] = time_ago(item.get("ctime"))
-        results.append(item)
+    now = datetime.now(tzlocal())
+    # Map every row onto the same key tuple, then fix up the computed fields
+    keys = projected_keys(project)
+    results = [dict(zip(keys, row)) for row in rows]
+    for item in results:
+        item["ctime"] = time_ago(item["ctime"], now=now)
     return results
 
 
+# Above this many rows an exact count of an unfiltered list costs a full scan
+# on every poll, the PostgreSQL planner estimate is used instead.
+ESTIMATED_COUNT_THRESHOLD = 100_000
+# How long the planner's size of the node table is trusted before re-reading it
+NODE_TABLE_SIZE_TTL = 60.0
+_node_table_size: Tuple[float, int] = (0.0, 0)
+
+
+def node_table_size(session) -> int:
+    """Return the planner estimate of the rows in ``db_dbnode``, cached for a minute."""
+    from sqlalchemy import text
+
+    global _node_table_size
+    expiry, size = _node_table_size
+    if expiry < time.monotonic():
+        size = session.execute(
+            text(
+                "SELECT CAST(reltuples AS BIGINT) FROM pg_class "
+                "WHERE relname = 'db_dbnode'"
+            )
+        ).scalar()
+        # reltuples is -1 for a table that was never analyzed
+        size = max(size or 0, 0)
+        _node_table_size = (time.monotonic() + NODE_TABLE_SIZE_TTL, size)
+    return size
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a select statement."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kwargs):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kwargs)
+
+
+def estimate_row_count(session, statement) -> Optional[int]:
+    """
+    Return the planner estimate of the number of rows of a statement.
+
+    Returns ``None`` if the storage is not PostgreSQL, or if the whole node
+    table is too small for an estimate to pay off. That check uses the cached
+    table size, so small databases do not pay for an extra EXPLAIN.
+    """
+    import json
+
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+    if node_table_size(session) < ESTIMATED_COUNT_THRESHOLD:
+        return None
+    plan = session.connection().execute(_Explain(statement)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def query_page_with_total(
+    qb, skip: int, limit: int, batch_size: int = 100, estimate_total: bool = False
+):
+    """
+    Return one page of projected rows together with the total number of matches.
+
+    The total is computed in the same statement with a ``COUNT(*) OVER ()``
+    window column, instead of a separate ``qb.count()`` round-trip. Rows are
+    fetched from the cursor in batches, like ``QueryBuilder.iterall``, and
+    converted as they arrive.
+
+    With ``estimate_total``, large results report the planner estimate as the
+    total instead, which avoids counting every matching row.
+    """
+    from contextlib import nullcontext
+
+    from sqlalchemy import func
+
+    backend_qb = qb._impl
+    session = backend_qb.get_session()
+
+    total = None
+    if estimate_total:
+        qb.offset(None).limit(None)
+        # query_session closes the session if a statement fails, so the pooled
+        # thread is not left in an aborted transaction
+        with backend_qb.query_session(qb.as_dict()) as build:
+            estimate = estimate_row_count(session, build.query.statement)
+        if estimate is not None and estimate >= ESTIMATED_COUNT_THRESHOLD:
+            total = estimate
+    estimated = total is not None
+
+    qb.offset(skip).limit(limit)
+    rows = []
+    with backend_qb.query_session(qb.as_dict()) as build:
+        query = build.query
+        if not estimated:
+            query = query.add_columns(func.count().over().label("total"))
+        stmt = query.statement.execution_options(yield_per=batch_size)
+        # like QueryBuilder.iterall, keep the cursor inside one transaction
+        if session.in_nested_transaction():
+            transaction = nullcontext()
+        else:
+            transaction = backend_qb._backend.transaction()
+        with transaction:
+            for row in session.execute(stmt):
+                if not estimated:
+                    total, row = row[-1], row[:-1]
+                rows.append([backend_qb.to_backend(value) for value in row])
+
+    if not rows:
+        # past the end there is nothing to count or clamp, use a real count
+        total = qb.offset(None).limit(None).count() if skip else 0
+    elif estimated:
+        # keep the estimate consistent with what the pages actually return
+        if len(rows) < limit:
+            total = skip + len(rows)
+        else:
+            total = max(total, skip + len(rows))
+    return total, rows
+
+
+def fetch_page(
+    qb,
+    skip: int,
+    limit: int,
+    get_data_func: callable,
+    project,
+    estimate_total: bool = False,
+):
+    """
+    Query the requested page and convert it to dictionaries.
+
+    This runs blocking database queries, so the endpoints call it through
+    ``run_in_db_thread`` instead of directly on the event loop.
+    """
+    total, rows = query_page_with_total(qb, skip, limit, estimate_total=estimate_total)
+    return total, get_data_func(rows, project)
+
+
 def make_node_router(
     *,  # force kwargs
     node_cls: Type[orm.Node],  # ⬛  WHICH NODE TYPE
@@ -68,6 +276,7 @@ def make_node_router(
     project: Optional[List[str]] = None,
     get_data_func: callable = projected_data_to_dict,
     inclue_delete_route: bool = True,
+    sort_field_map: Optional[Dict[str, str]] = None,  # DataGrid field → column
 ) -> APIRouter:
     """
     Return an APIRouter exposing GET /…-data, PUT /…-data/{id},
@@ -82,21 +291,28 @@ def make_node_router(
     from aiida.tools import delete_nodes
     from aiida_gui.app.utils import (
         translate_datagrid_filter_json,
+        run_in_db_thread,
+        ORJSONResponse,
     )
 
+    project = project or ["id", "uuid", "ctime", "label", "description"]
     router = APIRouter()
 
     # -------------------- GET /…-data --------------------
-    @router.get(f"/api/{prefix}-data")
+    @router.get(f"/api/{prefix}-data", response_class=ORJSONResponse)
     async def read_node_data(
         skip: int = Query(0, ge=0),
         limit: int = Query(15, gt=0, le=500),
-        sortField: str = Query(
-            "pk", pattern="^(pk|ctime|process_label|state|label|description)$"
-        ),
-        sortOrder: str = Query("desc", pattern="^(asc|desc)$"),
+        sortField: SortField = Query("pk"),
+        sortOrder: SortOrder = Query("desc"),
         filterModel: Optional[str] = Query(None),
     ):
+        cache_key = (prefix, skip, limit, sortField, sortOrder)
+        if filterModel is None:
+            payload = get_cached_page(cache_key)
+            if payload is not None:
+                return ORJSONResponse(payload)
+
         qb = QueryBuilder()
         filters = (
             translate_datagrid_filter_json(filterModel, project=project)
@@ -106,16 +322,25 @@ def make_node_router(
         qb.append(
             node_cls,
             filters=filters,
-            project=project or ["id", "uuid", "ctime", "label", "description"],
+            project=project,
             tag="data",
         )
 
-        qb.order_by({"data": {sortField: sortOrder}})
-        total = qb.count()
-        qb.offset(skip).limit(limit)
-
-        results = get_data_func(qb, project)
-        return {"total": total, "data": results}
+        qb.order_by({"data": datagrid_order_by(sortField, sortOrder, sort_field_map)})
+        # the DataGrid tolerates an approximate total for unfiltered lists
+        total, results = await run_in_db_thread(
+            fetch_page,
+            qb,
+            skip,
+            limit,
+            get_data_func,
+            project,
+            estimate_total=filterModel is None,
+        )
+        payload = {"total": total, "data": results}
+        if filterModel is None:
+            cache_page(cache_key, payload)
+        return ORJSONResponse(payload)
 
     # -------------------- PUT /…-data/{id} --------------------
     @router.put(f"/api/{prefix}-data" + "/{id}")
@@ -137,6 +362,7 @@ def make_node_router(
                 touched = True
         if not touched:
             raise HTTPException(status_code=400, detail="No updatable fields provided")
+        clear_page_cache()
         return {"updated": True, "pk": id, **{k: getattr(node, k) for k in allowed}}
 
     # -------------------- pause / play / delete -------------
@@ -144,6 +370,7 @@ def make_node_router(
     async def pause(id: int):
         try:
             pause_processes([orm.load_node(id)])
+            clear_page_cache()
             return {"message": f"Paused {node_cls.__name__} {id}"}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
@@ -152,6 +379,7 @@ def make_node_router(
     async def play(id: int):
         try:
             play_processes([orm.load_node(id)])
+            clear_page_cache()
             return {"message": f"Resumed {node_cls.__name__} {id}"}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
@@ -160,18 +388,84 @@ def make_node_router(
     async def kill(id: int):
         try:
             kill_processes([orm.load_node(id)])
+            clear_page_cache()
             return {"message": f"Resumed {node_cls.__name__} {id}"}
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
+    # -------------------- batch pause / play / kill / delete -------------
+    def load_nodes(ids: List[int]) -> List[orm.Node]:
+        """Load all selected nodes with a single query."""
+        qb = QueryBuilder().append(node_cls, filters={"id": {"in": ids}})
+        nodes = qb.all(flat=True)
+        missing = set(ids) - {node.pk for node in nodes}
+        if missing:
+            raise HTTPException(
+                status_code=404,
+                detail=f"{node_cls.__name__} {sorted(missing)} not found",
+            )
+        return nodes
+
+    @router.post(f"/api/{prefix}/pause")
+    async def pause_many(ids: List[int] = Body(..., min_length=1)):
+        nodes = load_nodes(ids)
+        try:
+            pause_processes(nodes)
+            clear_page_cache()
+            return {"message": f"Paused {node_cls.__name__} {ids}"}
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @router.post(f"/api/{prefix}/play")
+    async def play_many(ids: List[int] = Body(..., min_length=1)):
+        nodes = load_nodes(ids)
+        try:
+            play_processes(nodes)
+            clear_page_cache()
+            return {"message": f"Resumed {node_cls.__name__} {ids}"}
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @router.post(f"/api/{prefix}/kill")
+    async def kill_many(ids: List[int] = Body(..., min_length=1)):
+        nodes = load_nodes(ids)
+        try:
+            kill_processes(nodes)
+            clear_page_cache()
+            return {"message": f"Killed {node_cls.__name__} {ids}"}
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
     if inclue_delete_route:
 
+        @router.delete(f"/api/{prefix}/delete")
+        async def delete_many(
+            ids: List[int] = Body(..., min_length=1), dry_run: bool = False
+        ) -> Dict[str, Union[bool, str, List[int]]]:
+            load_nodes(ids)
+            try:
+                deleted, ok = delete_nodes(ids, dry_run=dry_run)
+                if not dry_run:
+                    clear_page_cache()
+                return {
+                    "deleted": ok,
+                    "message": (
+                        f"{'Deleted' if ok else 'Did not delete'} {node_cls.__name__} {ids}"
+                        + (" [dry‑run]" if dry_run else "")
+                    ),
+                    "deleted_nodes": list(deleted),
+                }
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=str(e))
+
         @router.delete(f"/api/{prefix}/delete" + "/{id}")
         async def delete(
             id: int, dry_run: bool = False
         ) -> Dict[str, Union[bool, str, List[int]]]:
             try:
                 deleted, ok = delete_nodes([id], dry_run=dry_run)
+                if not dry_run:
+                    clear_page_cache()
                 return {
                     "deleted": ok,
                     "message": (
@@ -3,10 +3,12 @@ from aiida_gui.app.node_table import (
     process_project,
     projected_data_to_dict_process,
 )
-import traceback
+import logging
 from fastapi import HTTPException
 from aiida import orm
-from .utils import get_node_summary
+from .utils import get_node_summary, run_in_db_thread, ORJSONResponse
+
+logger = logging.getLogger(__name__)
 
 router = make_node_router(
     node_cls=orm.ProcessNode,
@@ -27,16 +29,20 @@ async def read_process(id: int):
     return data
 
 
-@router.get("/api/process-logs/{id}")
-async def read_workgraph_logs(id: int):
+def get_report_lines(node) -> list:
+    """Collect the REPORT log of a process as a list of lines."""
     from aiida.cmdline.utils.common import get_workchain_report
 
+    return get_workchain_report(node, "REPORT").splitlines()
+
+
+@router.get("/api/process-logs/{id}")
+async def read_workgraph_logs(id: int):
     try:
         node = orm.load_node(id)
-        report = get_workchain_report(node, "REPORT")
-        logs = report.splitlines()
-        return logs
+        # the report of a long running workflow can take a while to collect
+        logs = await run_in_db_thread(get_report_lines, node)
     except KeyError as e:
-        error_traceback = traceback.format_exc()  # Capture the full traceback
-        print(error_traceback)
+        logger.debug("Process %s logs lookup failed", id, exc_info=True)
         raise HTTPException(status_code=404, detail=f"Workgraph {id} not found, {e}")
+    return ORJSONResponse(logs)
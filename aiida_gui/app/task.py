@@ -2,13 +2,32 @@ from .utils import get_node_summary_table, get_node_inputs, get_node_outputs
 from aiida.orm.utils.serialize import deserialize_unsafe
 from aiida import orm
 from fastapi import APIRouter, HTTPException
-import traceback
+import logging
+from functools import lru_cache
 from typing import List
 from aiida.engine.processes import control
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
+@lru_cache(maxsize=4096)
+def _deserialize_task(node_pk: int, task_name: str, mtime: str) -> dict:
+    return deserialize_unsafe(orm.load_node(node_pk).workgraph_data["tasks"][task_name])
+
+
+def get_task_data(node, task_name: str) -> dict:
+    """Return the deserialized data of a task of a WorkGraphNode.
+
+    Deserializing is expensive, so the result is cached by node pk and task
+    name. The node mtime is part of the key, so updated nodes are read again.
+    Callers only set top-level fields like the executor, so each call gets a
+    shallow copy of the cached dict.
+    """
+    return dict(_deserialize_task(node.pk, task_name, node.mtime.isoformat()))
+
+
 @router.get("/api/task/{id}/{path:path}")
 async def read_task(id: int, path: str):
     from .utils import node_to_short_json
@@ -21,9 +40,10 @@ async def read_task(id: int, path: str):
         node = load_node(id)
         segments = path.split("/")
         if isinstance(node, WorkGraphNode):
-            ndata = node.workgraph_data["tasks"][segments[0]]
-            ndata = deserialize_unsafe(ndata)
-            executor = node.task_executors.get(segments[0], None)
+            # read the node attributes once, they are not cached on the node
+            executors = node.task_executors
+            ndata = get_task_data(node, segments[0])
+            executor = executors.get(segments[0], None)
             if len(segments) == 1:
                 ndata["executor"] = executor if executor else {}
                 content = node_to_short_json(id, ndata)
@@ -37,16 +57,17 @@ async def read_task(id: int, path: str):
                     content = node_to_short_json(None, ndata)
                 elif ndata["metadata"]["node_type"].upper() == "MAP":
                     map_info = node.task_map_info.get(segments[0])
+                    # segments[1] is "{prefix}_{child}", split it instead of
+                    # trying every (child, prefix) pair
+                    prefixes = set(map_info["prefix"])
                     for child in map_info["children"]:
-                        for prefix in map_info["prefix"]:
-                            if f"{prefix}_{child}" == segments[1]:
-                                ndata = deserialize_unsafe(
-                                    node.workgraph_data["tasks"][child]
-                                )
-                                executor = node.task_executors.get(child)
-                                ndata["name"] = f"{prefix}_{child}"
-                                ndata["executor"] = executor if executor else {}
-                                break
+                        prefix = segments[1][: -len(child) - 1]
+                        if segments[1].endswith(f"_{child}") and prefix in prefixes:
+                            ndata = get_task_data(node, child)
+                            executor = executors.get(child)
+                            ndata["name"] = segments[1]
+                            ndata["executor"] = executor if executor else {}
+                            break
                     content = node_to_short_json(id, ndata)
         elif isinstance(node, orm.WorkChainNode):
             pk = int(segments[0].split("-")[-1])
@@ -78,8 +99,7 @@ async def read_task(id: int, path: str):
             raise HTTPException(status_code=404, detail="Node not found")
         return content
     except KeyError as e:
-        error_traceback = traceback.format_exc()  # Capture the full traceback
-        print(error_traceback)
+        logger.debug("Process %s/%s lookup failed", id, path, exc_info=True)
         raise HTTPException(
             status_code=404, detail=f"Process {id}/{path} not found, {e}"
         )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from fastapi import HTTPException
 from aiida import orm
-import traceback
+import logging
 from aiida_gui.app.node_table import (
     make_node_router,
     process_project,
@@ -11,6 +11,8 @@ from aiida.orm import WorkChainNode
 from .utils import get_parent_processes
 
 
+logger = logging.getLogger(__name__)
+
 router = make_node_router(
     node_cls=WorkChainNode,
     prefix="workchain",
@@ -39,8 +41,7 @@ async def read_workchain(id: int):
         content["processes_info"] = {}
         return content
     except KeyError as e:
-        error_traceback = traceback.format_exc()  # Capture the full traceback
-        print(error_traceback)
+        logger.debug("Workchain %s lookup failed", id, exc_info=True)
         raise HTTPException(status_code=404, detail=f"Workchain {id} not found, {e}")
 
 
@@ -52,6 +53,5 @@ async def read_tasks_state(id: int, item_type: str = "called_process"):
         processes_info = get_processes_latest(id, item_type=item_type)
         return processes_info
     except KeyError as e:
-        error_traceback = traceback.format_exc()  # Capture the full traceback
-        print(error_traceback)
+        logger.debug("Workchain %s state lookup failed", id, exc_info=True)
         raise HTTPException(status_code=404, detail=f"Workchain {id} not found, {e}")
@@ -5,6 +5,23 @@ import signal
 from pathlib import Path
 
 
+# Compound indexes for the sort + node type filter of the list endpoints. They are
+# not part of the aiida-core schema, hence the ``ix_aiida_gui_`` prefix.
+NODE_INDEXES = {
+    "ix_aiida_gui_dbnode_ctime_id": "db_dbnode (ctime DESC, id)",
+    "ix_aiida_gui_dbnode_nodetype_ctime": "db_dbnode (node_type, ctime DESC)",
+}
+
+# Trigram indexes, so the ``%value%`` LIKE of the label and description column
+# filters does not scan the whole node table. They need the pg_trgm extension.
+TRIGRAM_INDEXES = {
+    "ix_aiida_gui_dbnode_label_trgm": "db_dbnode USING gin (label gin_trgm_ops)",
+    "ix_aiida_gui_dbnode_description_trgm": (
+        "db_dbnode USING gin (description gin_trgm_ops)"
+    ),
+}
+
+
 def get_package_root():
     """Returns the root directory of the package."""
     current_file = Path(__file__)
@@ -101,5 +118,69 @@ def stop():
     click.echo("Cleaned up PID file.")
 
 
+@cli.command("indexes")
+@click.option("--profile", "-p", default=None, help="AiiDA profile to use.")
+@click.option(
+    "--drop",
+    is_flag=True,
+    default=False,
+    help="Drop the indexes created by this command instead.",
+)
+@click.option(
+    "--trigram",
+    is_flag=True,
+    default=False,
+    help="Also create trigram indexes for text filters on label and description.",
+)
+def indexes(profile, drop, trigram):
+    """Create extra database indexes that speed up the list views.
+
+    Only PostgreSQL storage is supported. The indexes are built concurrently,
+    so the database stays usable while they are created. Running it again
+    rebuilds indexes that an interrupted build left invalid. With ``--trigram``
+    the pg_trgm extension is enabled, which needs the CREATE privilege on the
+    database.
+    """
+    from aiida.manage import manager
+    from sqlalchemy import text
+
+    profile = manager.get_manager().load_profile(profile)
+    if profile.storage_backend != "core.psql_dos":
+        click.echo(f"Storage {profile.storage_backend} is not supported, skipping.")
+        return
+
+    targets = dict(NODE_INDEXES)
+    if trigram or drop:
+        targets.update(TRIGRAM_INDEXES)
+
+    engine = manager.get_manager().get_profile_storage().get_session().bind
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if trigram and not drop:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        for name, target in targets.items():
+            if drop:
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+                click.echo(f"Dropped index {name}.")
+                continue
+            valid = conn.execute(
+                text(
+                    "SELECT i.indisvalid FROM pg_index i "
+                    "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+                ),
+                {"name": name},
+            ).scalar()
+            if valid:
+                click.echo(f"Index {name} already exists.")
+                continue
+            if valid is False:
+                # an interrupted concurrent build leaves an INVALID index behind,
+                # which IF NOT EXISTS would silently keep
+                click.echo(f"Index {name} is invalid, rebuilding it.")
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+            conn.execute(text(f"CREATE INDEX CONCURRENTLY {name} ON {target}"))
+            click.echo(f"Created index {name}.")
+
+
 if __name__ == "__main__":
     cli()
@@ -14,3 +14,184 @@ def test_workgraph_route(client):
     """Sample test case for the root route"""
     response = client.get("/api/workchain-data")
     assert response.status_code == 200
+
+
+@pytest.mark.backend
+def test_datanode_page_cache_cleared_on_update(client):
+    """An update must not be hidden by the cached unfiltered page."""
+    from aiida import orm
+
+    node = orm.Int(1).store()
+    response = client.get("/api/datanode-data")
+    assert response.json()["data"][0]["pk"] == node.pk
+
+    response = client.put(f"/api/datanode-data/{node.pk}", json={"label": "renamed"})
+    assert response.status_code == 200
+    response = client.get("/api/datanode-data")
+    assert response.json()["data"][0]["label"] == "renamed"
+
+
+@pytest.mark.backend
+def test_datanode_batch_delete_dry_run(client):
+    """Several nodes can be deleted with one request."""
+    from aiida import orm
+
+    pks = [orm.Int(i).store().pk for i in range(2)]
+    response = client.request("DELETE", "/api/datanode/delete?dry_run=true", json=pks)
+    assert response.status_code == 200
+    assert set(pks) <= set(response.json()["deleted_nodes"])
+
+
+@pytest.mark.backend
+def test_datanode_batch_empty_ids(client):
+    """An empty selection is rejected instead of reaching the QueryBuilder."""
+    response = client.request("DELETE", "/api/datanode/delete", json=[])
+    assert response.status_code == 422
+    response = client.post("/api/datanode/pause", json=[])
+    assert response.status_code == 422
+
+
+@pytest.mark.backend
+def test_datanode_quick_filter_matches_pk_text(client):
+    """A quick-filter value matches pks that contain it, not only the exact pk."""
+    import json
+    from aiida import orm
+
+    node = orm.Int(1).store()
+    while node.pk < 10:
+        node = orm.Int(1).store()
+    value = str(node.pk)[:-1]
+    filter_model = json.dumps({"items": [], "quickFilterValues": [value]})
+    response = client.get(
+        "/api/datanode-data", params={"filterModel": filter_model, "limit": 500}
+    )
+    pks = [row["pk"] for row in response.json()["data"]]
+    assert node.pk in pks
+
+
+@pytest.mark.backend
+def test_sort_fields(client):
+    """Every sortable DataGrid column sorts without a server error."""
+    from aiida import orm
+
+    orm.Group.collection.get_or_create(label="test_sort_fields")
+    for url, field in [
+        ("/api/process-data", "paused"),
+        ("/api/groupnode-data", "ctime"),
+        ("/api/groupnode-data", "pk"),
+    ]:
+        response = client.get(url, params={"sortField": field, "sortOrder": "asc"})
+        assert response.status_code == 200, (url, field)
+
+
+@pytest.mark.backend
+def test_time_ago():
+    from datetime import datetime, timedelta, timezone
+    from aiida_gui.app.utils import time_ago
+
+    now = datetime(2024, 3, 1, 12, tzinfo=timezone.utc)
+    assert time_ago(now - timedelta(seconds=30), now=now) == "Just now"
+    assert time_ago(now - timedelta(minutes=5), now=now) == "5min ago"
+    assert time_ago(now - timedelta(hours=23, minutes=59), now=now) == "23h ago"
+    assert time_ago(now - timedelta(days=2), now=now) == "2D ago"
+    assert time_ago(now - timedelta(days=400), now=now) == "1Y ago"
+
+
+@pytest.mark.backend
+def test_datanode_estimated_total_on_last_pages(client, monkeypatch):
+    """A large planner estimate must not outlive the last page."""
+    from aiida import orm
+    from aiida_gui.app import node_table
+
+    for i in range(3):
+        orm.Int(i).store()
+    count = orm.QueryBuilder().append(orm.Data).count()
+    node_table.clear_page_cache()
+    monkeypatch.setattr(node_table, "estimate_row_count", lambda *args: 150_000)
+
+    response = client.get("/api/datanode-data", params={"skip": 0, "limit": 1})
+    assert response.json()["total"] == 150_000
+    # partial last page
+    response = client.get("/api/datanode-data", params={"skip": count - 1})
+    assert response.json()["total"] == count
+    # page past the end
+    response = client.get("/api/datanode-data", params={"skip": count + 100})
+    assert response.json() == {"total": count, "data": []}
+
+
+@pytest.mark.backend
+def test_query_page_closes_session_on_error(monkeypatch):
+    """A failed page query must not leave the thread's session in a transaction."""
+    from aiida import orm
+    from aiida_gui.app.node_table import query_page_with_total
+
+    for i in range(10):
+        orm.Int(i).store()
+    qb = orm.QueryBuilder().append(orm.Data, project=["id"])
+    count = qb.count()
+    session = qb._impl.get_session()
+
+    def fail(value):
+        raise RuntimeError("conversion failed")
+
+    monkeypatch.setattr(qb._impl, "to_backend", fail)
+    with pytest.raises(RuntimeError):
+        query_page_with_total(qb, 0, 10)
+    assert not session.in_transaction()
+
+    monkeypatch.undo()
+    total, rows = query_page_with_total(qb, 0, 10)
+    assert total == count and len(rows) == 10
+
+
+@pytest.mark.backend
+def test_get_parent_processes():
+    from aiida import orm
+    from aiida.engine import workfunction
+    from aiida_gui.app.utils import get_parent_processes
+
+    @workfunction
+    def inner(x):
+        return x
+
+    @workfunction
+    def middle(x):
+        return inner(x)
+
+    @workfunction
+    def outer(x):
+        return middle(x)
+
+    _, outer_node = outer.run_get_node(orm.Int(1))
+    middle_node = outer_node.called[0]
+    inner_node = middle_node.called[0]
+
+    parents = get_parent_processes(inner_node.pk)
+    assert [p["pk"] for p in parents] == [inner_node.pk, middle_node.pk, outer_node.pk]
+    labels = [p["label"].rsplit(".", 1)[-1] for p in parents]
+    assert labels == ["inner", "middle", "outer"]
+
+
+@pytest.mark.backend
+def test_indexes_command():
+    from aiida.manage import get_manager
+    from click.testing import CliRunner
+    from aiida_gui.cmd_web import cli, NODE_INDEXES
+
+    profile = get_manager().get_profile()
+    runner = CliRunner()
+    result = runner.invoke(cli, ["indexes", "-p", profile.name])
+    assert result.exit_code == 0, result.output
+    if profile.storage_backend != "core.psql_dos":
+        assert "is not supported, skipping" in result.output
+        return
+
+    for name in NODE_INDEXES:
+        assert f"Created index {name}." in result.output
+    result = runner.invoke(cli, ["indexes", "-p", profile.name])
+    for name in NODE_INDEXES:
+        assert f"Index {name} already exists." in result.output
+    result = runner.invoke(cli, ["indexes", "-p", profile.name, "--drop"])
+    assert result.exit_code == 0, result.output
+    for name in NODE_INDEXES:
+        assert f"Dropped index {name}." in result.output